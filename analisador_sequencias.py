@@ -1,6 +1,98 @@
+import sys
+from collections import Counter, OrderedDict, namedtuple
+from functools import lru_cache
+
 import requests
 from requests.exceptions import RequestException
 
+# abaixo desse tamanho o Counter (ou o .count() da string, no GC) é rápido o bastante,
+# acima disso compensa trabalhar direto nos bytes (.count() e .translate() rodam em C)
+LIMITE_SEQUENCIA_PEQUENA = 4096
+
+BASES_DNA = b'ACGT'
+BASES_RNA = b'ACGU'
+
+# todos os bytes menos G e C (usado para apagar o resto no cálculo de GC)
+NAO_GC = bytes(b for b in range(256) if b not in b'GC')
+
+# bases que o contador conhece e a tabela que apaga elas de uma string,
+# montadas uma vez só em vez de a cada chamada
+BASES_CONHECIDAS = [(chr(base), bytes([base])) for base in b'ACGTU']
+APAGAR_BASES_CONHECIDAS = str.maketrans('', '', 'ACGTU')
+
+# tamanho, contagem de bases e GC de uma sequencia (ver analisar_sequencia)
+Relatorio = namedtuple('Relatorio', ['tamanho', 'contagem', 'gc'])
+
+# tabela para deixar a sequencia em maiusculas e caracteres de espaço que são
+# apagados, usados juntos num único .translate() ao limpar a sequencia
+MAIUSCULAS = bytes.maketrans(b'abcdefghijklmnopqrstuvwxyz', b'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+ESPACOS = b' \t\n\r\x0b\x0c'
+
+# tabela usada na transcrição (T vira U, o resto fica igual)
+T_PARA_U = bytes.maketrans(b'T', b'U')
+
+# maior sequencia (em bases) que os caches guardam, acima disso nada fica guardado
+CACHE_MAX_BASES = 10_000_000
+
+# cache das buscas no NCBI: poucas entradas e só sequências de até CACHE_MAX_BASES
+CACHE_NCBI_MAX_ENTRADAS = 4
+_cache_ncbi = OrderedDict()
+
+# buffer de 1 MiB para gravar arquivos grandes com poucas chamadas de escrita
+TAMANHO_BUFFER_ARQUIVO = 1 << 20
+
+
+def _baixar_sequencia_ncbi(accession_id):
+    """
+    baixa a sequência do NCBI e devolve só as bases, já limpas.
+    """
+    # endereço da API do banco de dados NCBI
+    url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+    params = {
+        'db': 'nucleotide',  # banco de nucleotídeos
+        'id': accession_id,  # o ID fornecido
+        'rettype': 'fasta',  # formato FASTA
+        'retmode': 'text'    # texto simples
+    }
+
+    # faz a requisição para o NCBI e espera até 10 segundos
+    # stream=True vai lendo a resposta aos poucos em vez de guardar o texto inteiro
+    with requests.get(url, params=params, timeout=10, stream=True) as response:
+        response.raise_for_status()  # se der erro, para aqui
+
+        # formato FASTA, retorna com um cabeçalho (linha com >) e depois as linhas com a sequência.
+        # o necessario é somente a sequência, então cada linha que chega já é
+        # juntada no buffer, ignorando as que começam com '>' (cabeçalho)
+        sequencia_bytes = bytearray()
+        for linha in response.iter_lines():
+            if linha and not linha.startswith(b'>'):
+                sequencia_bytes.extend(linha)
+
+    # caractere estranho não derruba a busca, vira texto e a validação decide depois
+    return sequencia_bytes.translate(MAIUSCULAS, ESPACOS).decode('utf-8', 'replace')
+
+
+def _sequencia_ncbi(accession_id):
+    """
+    devolve a sequência do cache se o ID já foi buscado, senão baixa do NCBI.
+    o cache guarda no maximo CACHE_NCBI_MAX_ENTRADAS IDs e, quando enche, tira
+    o que foi usado há mais tempo (um ID buscado de novo volta para o fim da fila).
+    não guarda sequências vazias nem muito grandes (mais de CACHE_MAX_BASES),
+    assim um cromossomo inteiro não fica ocupando memória a sessão toda e um
+    ID que não foi encontrado é buscado de novo na proxima vez.
+    se der erro nada é guardado.
+    """
+    if accession_id in _cache_ncbi:
+        _cache_ncbi.move_to_end(accession_id)  # usado agora, vai para o fim da fila
+        return _cache_ncbi[accession_id]
+
+    sequencia = _baixar_sequencia_ncbi(accession_id)
+    if sequencia and len(sequencia) <= CACHE_MAX_BASES:
+        if len(_cache_ncbi) >= CACHE_NCBI_MAX_ENTRADAS:
+            _cache_ncbi.popitem(last=False)  # tira o usado há mais tempo
+        _cache_ncbi[accession_id] = sequencia
+    return sequencia
+
 
 def buscar_sequencia_ncbi(accession_id):
     """
@@ -9,25 +101,7 @@ def buscar_sequencia_ncbi(accession_id):
     try:
         print(f"\nBuscando sequência {accession_id} no NCBI...")
 
-        # endereço da API do banco de dados NCBI
-        url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-        params = {
-            'db': 'nucleotide',  # banco de nucleotídeos
-            'id': accession_id,  # o ID fornecido
-            'rettype': 'fasta',  # formato FASTA
-            'retmode': 'text'    # texto simples
-        }
-
-        # faz a requisição para o NCBI e espera até 10 segundos
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()  # se der erro, para aqui
-
-        # formato FASTA, retorna com um cabeçalho (linha com >) e depois as linhas com a sequência. 
-        # o necessario é somente a sequência, então o uso do .split(quebra de linha)
-        linhas = response.text.strip().split('\n')
-        # ignora as linhas que começam com '>' (cabeçalho) e junta o resto
-        sequencia = ''.join([linha for linha in linhas if not linha.startswith('>')])
-        sequencia = sequencia.upper().replace(' ', '').replace('\n', '')
+        sequencia = _sequencia_ncbi(accession_id)
 
         if sequencia:
             print(f"Sequência encontrada! ({len(sequencia)} bases)")
@@ -45,64 +119,137 @@ def buscar_sequencia_ncbi(accession_id):
         return None
 
 
+def normalizar_sequencia(texto):
+    """
+    deixa a sequencia em maiusculas e sem espaços, tabs ou quebras de linha
+    (em qualquer posição, não só no começo e no fim).
+    faz tudo numa passada só com o .translate() em vez de strip/upper/replace.
+    """
+    try:
+        return texto.encode('ascii').translate(MAIUSCULAS, ESPACOS).decode('ascii')
+    except UnicodeEncodeError:
+        # tem caractere fora do ASCII, tira os espaços em branco com o .split() do jeito normal
+        return ''.join(texto.split()).upper()
+
+
+@lru_cache(maxsize=1)
+def _para_bytes_guardado(sequencia):
+    """
+    converte a sequencia para bytes ASCII e guarda a ultima convertida.
+    """
+    return sequencia.encode('ascii')
+
+
+def _para_bytes(sequencia):
+    """
+    converte a sequencia para bytes ASCII.
+    sequencias de até CACHE_MAX_BASES ficam guardadas (só a ultima), assim
+    validar, contar as bases e transcrever a mesma sequencia não repetem o .encode().
+    as maiores são convertidas a cada chamada para não deixar uma copia
+    inteira (um cromossomo tem ~250 MB) presa na memória a sessão toda.
+    """
+    if len(sequencia) > CACHE_MAX_BASES:
+        return sequencia.encode('ascii')
+    return _para_bytes_guardado(sequencia)
+
+
+def _so_tem_bases(sequencia, bases_validas):
+    """
+    verifica se a sequencia só tem as bases informadas.
+    o .translate() apaga todas as bases validas de uma vez (em C), se sobrar
+    alguma coisa é porque tinha caractere invalido.
+    """
+    try:
+        sequencia_bytes = _para_bytes(sequencia)
+    except UnicodeEncodeError:
+        return False  # caractere fora do ASCII nunca é base valida
+    return not sequencia_bytes.translate(None, bases_validas)
+
+
 def validar_dna(sequencia):
     """
     verifica se a sequencia é DNA (só pode ter as bases A, T, C e G. se tiver qualquer outra coisa, não é DNA válido).
     """
-    bases_validas = {'A', 'T', 'C', 'G'}
-    for base in sequencia:
-        if base not in bases_validas:
-            return False  # nao é DNA
-    return True  # é DNA
+    return _so_tem_bases(sequencia, BASES_DNA)
 
 
 def validar_rna(sequencia):
     """
     verifica se a sequência é realmente RNA (só pode ter A, U, C e G).
     """
-    bases_validas = {'A', 'U', 'C', 'G'}
-    for base in sequencia:
-        if base not in bases_validas:
-            return False  # nao é RNA
-    return True  # é RNA
+    return _so_tem_bases(sequencia, BASES_RNA)
+
+
+def _contar_bases_conhecidas(sequencia):
+    """
+    conta A, C, G, T e U e quantos caracteres sobram (invalidos).
+    faz um .count() nos bytes para cada base (cinco passadas, mas cada uma em C).
+    """
+    sequencia_bytes = _para_bytes(sequencia)
+    contagem = {base: sequencia_bytes.count(base_bytes) for base, base_bytes in BASES_CONHECIDAS}
+    invalidos = len(sequencia_bytes) - sum(contagem.values())
+    return contagem, invalidos
 
 
 def contar_bases(sequencia):
     """
     conta quantas vezes cada base aparece na sequência.
     """
-    contagem = {}
-    for base in sequencia:
-        if base in contagem:
-            contagem[base] += 1  # se ja apareceu conta +1
-        else:
-            contagem[base] = 1  # se é a primeira vez valor == 1
+    if len(sequencia) < LIMITE_SEQUENCIA_PEQUENA:
+        return dict(Counter(sequencia))
+
+    # sequencias grandes: usa a contagem das bases conhecidas e so passa o
+    # Counter no que sobrar (normalmente nada), assim nao passa base por base no Python
+    try:
+        contagem_conhecidas, invalidos = _contar_bases_conhecidas(sequencia)
+    except UnicodeEncodeError:
+        return dict(Counter(sequencia))  # tem caractere fora do ASCII
+
+    contagem = {base: quantidade for base, quantidade in contagem_conhecidas.items() if quantidade}
+    if invalidos:
+        resto = sequencia.translate(APAGAR_BASES_CONHECIDAS)
+        contagem.update(Counter(resto))
     return contagem
 
 
-def calcular_conteudo_gc(sequencia):
+def _porcentagem_gc(gc, total):
     """
-    calcula percentual da sequencia que é formado por G e C juntos.
-    GC é importante porque diz muito sobre a estabilidade da sequência.
+    transforma a quantidade de G + C em porcentagem da sequencia.
+    usado pelo calcular_conteudo_gc e pelo relatorio, para os dois darem o mesmo valor.
     """
-    if len(sequencia) == 0:
+    if total == 0:
         return 0  # se a sequencia for vazia retorna 0
 
-    # conta quantas vezes G e C aparecem
-    g = sequencia.count('G')
-    c = sequencia.count('C')
-    total = len(sequencia)
-
-    # calcula a porcentagem
-    porcentagem_gc = ((g + c) / total) * 100
+    porcentagem_gc = (gc / total) * 100
     return round(porcentagem_gc, 2)  # arredonda para 2 casas decimais
 
 
+def calcular_conteudo_gc(sequencia):
+    """
+    calcula percentual da sequencia que é formado por G e C juntos.
+    GC é importante porque diz muito sobre a estabilidade da sequência.
+    """
+    if len(sequencia) < LIMITE_SEQUENCIA_PEQUENA:
+        gc = sequencia.count('G') + sequencia.count('C')
+    else:
+        # sequencias grandes: conta G e C numa passada só, o .translate() apaga
+        # tudo que não é G nem C e o que sobra é exatamente a quantidade de G + C
+        try:
+            gc = len(sequencia.encode('ascii').translate(None, NAO_GC))
+        except UnicodeEncodeError:
+            gc = sequencia.count('G') + sequencia.count('C')
+    return _porcentagem_gc(gc, len(sequencia))
+
+
 def transcrever_dna_para_rna(sequencia_dna):
     """
     Converte DNA para RNA, troca todas as T (timina) por U (uracila).
     """
-    rna = sequencia_dna.replace('T', 'U')
+    try:
+        # troca T por U direto nos bytes (tabela de 256 posições, sem tratar Unicode)
+        rna = _para_bytes(sequencia_dna).translate(T_PARA_U).decode('ascii')
+    except UnicodeEncodeError:
+        rna = sequencia_dna.replace('T', 'U')
     return rna
 
 
@@ -113,37 +260,57 @@ def calcular_tamanho_sequencia(sequencia):
     return len(sequencia)
 
 
+def analisar_sequencia(sequencia):
+    """
+    faz a analise do relatorio: tamanho, contagem de bases e conteudo GC.
+    as bases são contadas uma vez só (com contar_bases: Counter para sequencias
+    pequenas, um .count() nos bytes por base para as grandes) e o GC sai dessa
+    mesma contagem em vez de percorrer a sequencia de novo.
+    """
+    tamanho = calcular_tamanho_sequencia(sequencia)
+    contagem = contar_bases(sequencia)
+
+    gc = contagem.get('G', 0) + contagem.get('C', 0)
+    return Relatorio(tamanho, contagem, _porcentagem_gc(gc, tamanho))
+
+
 def exibir_relatorio(sequencia, tipo='DNA'):
     """
     mostra um relatorio de informações sobre a sequencia
     """
-    print("\n" + "="*60)
-    print("RELATÓRIO DE ANÁLISE DE SEQUÊNCIA")
-    print("="*60)
+    # junta as linhas numa lista e escreve tudo de uma vez no final
+    linhas = []
+    linhas.append("\n" + "="*60)
+    linhas.append("RELATÓRIO DE ANÁLISE DE SEQUÊNCIA")
+    linhas.append("="*60)
 
     # mostra o tipo da sequencia
-    print(f"\nTipo de sequência: {tipo}")
+    linhas.append(f"\nTipo de sequência: {tipo}")
+
+    # conta as bases uma vez só (contar_bases) e tira o tamanho e o GC dessa contagem
+    relatorio = analisar_sequencia(sequencia)
+    tamanho = relatorio.tamanho
 
     # quantas bases tem no total
-    tamanho = calcular_tamanho_sequencia(sequencia)
-    print(f"Tamanho da sequência: {tamanho} bases")
+    linhas.append(f"Tamanho da sequência: {tamanho} bases")
 
     # conta cada tipo de base e mostra o percentual
-    print("\n--- Contagem de Bases ---")
-    contagem = contar_bases(sequencia)
+    linhas.append("\n--- Contagem de Bases ---")
+    contagem = relatorio.contagem
     for base in sorted(contagem.keys()):
         porcentagem = (contagem[base] / tamanho) * 100
-        print(f"  {base}: {contagem[base]} ({porcentagem:.2f}%)")
+        linhas.append(f"  {base}: {contagem[base]} ({porcentagem:.2f}%)")
 
     # só calcula GC para DNA (RNA não tem esse conceito da mesma forma)
     if tipo == 'DNA':
-        gc = calcular_conteudo_gc(sequencia)
-        print(f"\nConteúdo GC: {gc}%")
+        linhas.append(f"\nConteúdo GC: {relatorio.gc}%")
 
     # mostra os primeiros 20 caracteres e os ultimas 20 caso seja maior
-    print(f"\nPrimeiros 20 caracteres: {sequencia[:20]}")
+    linhas.append(f"\nPrimeiros 20 caracteres: {sequencia[:20]}")
     if len(sequencia) > 20:
-        print(f"Últimos 20 caracteres: {sequencia[-20:]}")
+        linhas.append(f"Últimos 20 caracteres: {sequencia[-20:]}")
+
+    sys.stdout.write("\n".join(linhas) + "\n")
 
 
 def salvar_resultado(arquivo_saida, conteudo):
@@ -151,7 +318,10 @@ def salvar_resultado(arquivo_saida, conteudo):
     salva o resultado em um arquivo de texto.
     """
     try:
-        with open(arquivo_saida, 'w', encoding='utf-8') as f:
+        # o conteudo é só A, C, G e U, então converte para bytes ASCII e grava direto em modo binario
+        if isinstance(conteudo, str):
+            conteudo = conteudo.encode('ascii')
+        with open(arquivo_saida, 'wb', buffering=TAMANHO_BUFFER_ARQUIVO) as f:
             f.write(conteudo)
         print(f"\nResultado salvo em: {arquivo_saida}")
     except Exception as e:
@@ -187,8 +357,8 @@ def main():
 
         if opcao == '1':
             # sequencia digitada manualmente
-            sequencia = input("\nDigite a sequência: ").strip().upper()  # .strip() remove os espaços em branco no inicio e no fim, e o .upper() deixa tudo maiusculo
-            sequencia = sequencia.replace(' ', '').replace('\n', '')  # limpa outros espaços em branco e quebras de texto
+            sequencia = input("\nDigite a sequência: ")
+            sequencia = normalizar_sequencia(sequencia)  # deixa tudo maiusculo e limpa espaços em branco e quebras de texto
 
             if sequencia:
                 if validar_dna(sequencia):